@@ -1,6 +1,6 @@
 import re
 import ast
-from typing import List, Dict, Any, Tuple
+from typing import List, Dict, Any, Iterator, Tuple
 
 class SecurityPatternChecker:
     def __init__(self):
@@ -22,155 +22,184 @@ class SecurityPatternChecker:
             'memory_leaks': r'(?:append|extend|add)\([^)]*\)(?!.*?limit|.*?max)',
         }
 
-    def check_credentials(self, code: str) -> List[Dict[str, Any]]:
-        """Check for credential-related issues"""
-        issues = []
-        
-        # Check for hardcoded secrets
-        for match in re.finditer(self.credential_patterns['hardcoded_secrets'], code):
-            issues.append({
+        # Metadata for each checked pattern, keyed by regex group name
+        self._issue_meta = {
+            'hardcoded_secrets': {
                 'severity': 'Critical',
                 'category': 'Security',
                 'type': 'Hardcoded secrets',
-                'location': f'Line {code.count(chr(10), 0, match.start()) + 1}',
                 'description': 'Hardcoded credential found in code',
-                'proof': match.group(0),
                 'fix': 'Use environment variables or secure secret storage'
-            })
-            
-        return issues
-
-    def check_injections(self, code: str) -> List[Dict[str, Any]]:
-        """Check for various injection vulnerabilities"""
-        issues = []
-        
-        # Check for SQL injection
-        for match in re.finditer(self.injection_patterns['sql_injection'], code):
-            issues.append({
+            },
+            'sql_injection': {
                 'severity': 'Critical',
                 'category': 'Security',
                 'type': 'SQL Injection',
-                'location': f'Line {code.count(chr(10), 0, match.start()) + 1}',
                 'description': 'Potential SQL injection through string formatting',
-                'proof': match.group(0),
                 'fix': 'Use parameterized queries'
-            })
-            
-        # Check for command injection
-        for match in re.finditer(self.injection_patterns['command_injection'], code):
-            issues.append({
+            },
+            'command_injection': {
                 'severity': 'Critical',
                 'category': 'Security',
                 'type': 'Command Injection',
-                'location': f'Line {code.count(chr(10), 0, match.start()) + 1}',
                 'description': 'Potential command injection through string formatting',
-                'proof': match.group(0),
                 'fix': 'Use subprocess.run with a list of arguments'
-            })
-            
-        return issues
-
-    def check_resources(self, code: str) -> List[Dict[str, Any]]:
-        """Check for resource management issues"""
-        issues = []
-        
-        # Check for file leaks
-        for match in re.finditer(self.resource_patterns['file_leaks'], code):
-            issues.append({
+            },
+            'file_leaks': {
                 'severity': 'High',
                 'category': 'Code Quality',
                 'type': 'Resource leak',
-                'location': f'Line {code.count(chr(10), 0, match.start()) + 1}',
                 'description': 'File opened without using context manager',
-                'proof': match.group(0),
                 'fix': 'Use "with open(...) as f:" pattern'
-            })
-            
-        # Check for infinite loops
-        for match in re.finditer(self.resource_patterns['infinite_loops'], code):
-            issues.append({
+            },
+            'infinite_loops': {
                 'severity': 'High',
                 'category': 'Logic',
                 'type': 'Infinite loop',
-                'location': f'Line {code.count(chr(10), 0, match.start()) + 1}',
                 'description': 'Potential infinite loop without break condition',
-                'proof': match.group(0),
                 'fix': 'Add proper exit condition'
+            },
+        }
+
+        # Fuse all checked patterns into one alternation so the source is
+        # scanned once instead of once per pattern
+        all_patterns = {
+            'hardcoded_secrets': self.credential_patterns['hardcoded_secrets'],
+            'sql_injection': self.injection_patterns['sql_injection'],
+            'command_injection': self.injection_patterns['command_injection'],
+            'file_leaks': self.resource_patterns['file_leaks'],
+            'infinite_loops': self.resource_patterns['infinite_loops'],
+        }
+        self._combined = re.compile(
+            '|'.join(f'(?P<{name}>{pattern})' for name, pattern in all_patterns.items())
+        )
+
+    def _scan(self, code: str) -> Iterator[Tuple[str, Dict[str, Any]]]:
+        """Single fused pass over the code, yielding (pattern name, issue) pairs.
+
+        Every checked pattern targets a single-line construct, so the scan
+        walks the source a line at a time: the line number comes straight
+        from the enumerator and the regex engine never has to carry match
+        state across line boundaries. Issues are yielded as they are found,
+        so callers never hold more than one in flight and can stop early.
+        """
+        for lineno, line in enumerate(code.split('\n'), 1):
+            for match in self._combined.finditer(line):
+                name = match.lastgroup
+                meta = self._issue_meta[name]
+                yield (name, {
+                    'severity': meta['severity'],
+                    'category': meta['category'],
+                    'type': meta['type'],
+                    'location': f'Line {lineno}',
+                    'description': meta['description'],
+                    'proof': match.group(0),
+                    'fix': meta['fix']
+                })
+
+    def check_credentials(self, code: str) -> Iterator[Dict[str, Any]]:
+        """Check for credential-related issues"""
+        for name, issue in self._scan(code):
+            if name == 'hardcoded_secrets':
+                yield issue
+
+    def check_injections(self, code: str) -> Iterator[Dict[str, Any]]:
+        """Check for various injection vulnerabilities"""
+        for name, issue in self._scan(code):
+            if name in ('sql_injection', 'command_injection'):
+                yield issue
+
+    def check_resources(self, code: str) -> Iterator[Dict[str, Any]]:
+        """Check for resource management issues"""
+        for name, issue in self._scan(code):
+            if name in ('file_leaks', 'infinite_loops'):
+                yield issue
+
+class _LogicVisitor(ast.NodeVisitor):
+    """Collects null-pointer and error-handling issues in one traversal"""
+
+    def __init__(self):
+        self.null_pointer_issues = []
+        self.error_handling_issues = []
+
+    def visit_Attribute(self, node):
+        # Attribute access without existence check
+        self.null_pointer_issues.append({
+            'severity': 'High',
+            'category': 'Logic',
+            'type': 'Null pointer',
+            'location': f'Line {node.lineno}',
+            'description': 'Potential null pointer dereference',
+            'fix': 'Add null check before accessing attribute'
+        })
+        self.generic_visit(node)
+
+    def visit_ExceptHandler(self, node):
+        # Bare except clause
+        if node.type is None:
+            self.error_handling_issues.append({
+                'severity': 'Medium',
+                'category': 'Code Quality',
+                'type': 'Broad exception handling',
+                'location': f'Line {node.lineno}',
+                'description': 'Using bare except clause',
+                'fix': 'Catch specific exceptions'
             })
-            
-        return issues
+        self.generic_visit(node)
 
 class LogicPatternChecker:
+    def collect(self, tree: ast.AST) -> Tuple[List[Dict[str, Any]], List[Dict[str, Any]]]:
+        """Walk an already-parsed tree once, returning (null pointer, error handling) issues"""
+        visitor = _LogicVisitor()
+        visitor.visit(tree)
+        return visitor.null_pointer_issues, visitor.error_handling_issues
+
     def check_null_pointers(self, code: str) -> List[Dict[str, Any]]:
         """Check for potential null pointer issues"""
-        tree = ast.parse(code)
-        issues = []
-        
-        for node in ast.walk(tree):
-            # Check for attribute access without existence check
-            if isinstance(node, ast.Attribute):
-                issues.append({
-                    'severity': 'High',
-                    'category': 'Logic',
-                    'type': 'Null pointer',
-                    'location': f'Line {node.lineno}',
-                    'description': 'Potential null pointer dereference',
-                    'fix': 'Add null check before accessing attribute'
-                })
-                
-        return issues
+        return self.collect(ast.parse(code))[0]
 
     def check_error_handling(self, code: str) -> List[Dict[str, Any]]:
         """Check for error handling issues"""
-        tree = ast.parse(code)
-        issues = []
-        
-        for node in ast.walk(tree):
-            # Check for bare except clauses
-            if isinstance(node, ast.ExceptHandler) and node.type is None:
-                issues.append({
-                    'severity': 'Medium',
-                    'category': 'Code Quality',
-                    'type': 'Broad exception handling',
-                    'location': f'Line {node.lineno}',
-                    'description': 'Using bare except clause',
-                    'fix': 'Catch specific exceptions'
-                })
-                
-        return issues
+        return self.collect(ast.parse(code))[1]
 
 def analyze_code(code: str) -> Dict[str, List[Dict[str, Any]]]:
     """Main function to analyze code for all patterns"""
     security_checker = SecurityPatternChecker()
     logic_checker = LogicPatternChecker()
     
+    # One fused pass over the code, bucketing issues by pattern group
+    security_issues = []
+    resource_issues = []
+    for name, issue in security_checker._scan(code):
+        if name in ('file_leaks', 'infinite_loops'):
+            resource_issues.append(issue)
+        else:
+            security_issues.append(issue)
+
+    # Parse once and collect both logic checks in a single traversal
+    null_issues, error_issues = logic_checker.collect(ast.parse(code))
+
     results = {
-        'security_issues': (
-            security_checker.check_credentials(code) +
-            security_checker.check_injections(code)
-        ),
-        'resource_issues': security_checker.check_resources(code),
-        'logic_issues': (
-            logic_checker.check_null_pointers(code) +
-            logic_checker.check_error_handling(code)
-        )
+        'security_issues': security_issues,
+        'resource_issues': resource_issues,
+        'logic_issues': null_issues + error_issues
     }
-    
+
     return results
 
 def generate_report(results: Dict[str, List[Dict[str, Any]]]) -> str:
     """Generate a formatted report from analysis results"""
-    report = []
-    
-    for category, issues in results.items():
-        if issues:
-            report.append(f"\n=== {category.upper().replace('_', ' ')} ===")
-            for i, issue in enumerate(issues, 1):
-                report.append(f"\nISSUE {i}:")
-                for key, value in issue.items():
-                    report.append(f"- {key.upper()}: {value}")
-                    
-    return "\n".join(report)
+    def lines():
+        for category, issues in results.items():
+            if issues:
+                yield f"\n=== {category.upper().replace('_', ' ')} ==="
+                for i, issue in enumerate(issues, 1):
+                    yield f"\nISSUE {i}:"
+                    for key, value in issue.items():
+                        yield f"- {key.upper()}: {value}"
+
+    # join over a generator: no intermediate report list to grow and resize
+    return "\n".join(lines())
 
 # Example usage:
 if __name__ == "__main__":
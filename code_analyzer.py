@@ -1,7 +1,111 @@
-import re
+try:
+    # Prefer Google's RE2: a DFA engine with guaranteed linear-time matching,
+    # immune to catastrophic backtracking on adversarial inputs
+    import re2 as re
+except ImportError:
+    import re
+try:
+    # Optional Aho-Corasick automaton for the literal anchor prefilter
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
+try:
+    # Optional Hyperscan for SIMD-accelerated multi-pattern block scanning
+    import hyperscan
+except ImportError:
+    hyperscan = None
+try:
+    # Optional NumPy for the vectorized newline scan on large files
+    import numpy as np
+except ImportError:
+    np = None
 import ast
-from typing import List, Dict, Any
-from pathlib import Path
+import bisect
+import mmap
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from functools import lru_cache
+from operator import attrgetter
+from typing import List, Dict, Any, Sequence
+
+# File extension to language, hoisted so _get_file_type allocates nothing
+_EXT_MAP = {
+    '.py': 'python',
+    '.js': 'javascript',
+    '.jsx': 'javascript',
+    '.ts': 'typescript',
+    '.tsx': 'typescript'
+}
+
+# Severity rank used for sorting, hoisted so the sort key is a plain lookup
+_SEVERITY_RANK = {'Critical': 0, 'High': 1, 'Medium': 2, 'Low': 3}
+
+# Base confidence by severity
+_SEVERITY_CONFIDENCE = {'Critical': 0.95, 'High': 0.85, 'Medium': 0.75, 'Low': 0.65}
+
+# Known safe patterns matched against an issue's proof (a decoded str)
+_SAFE_PROOF_PATTERNS = {
+    'hardcoded_secrets': (
+        re.compile(r'os\.getenv'),
+        re.compile(r'process\.env'),
+        re.compile(r'config\.get')
+    ),
+    'sql_injection': (
+        re.compile(r'parameterize\('),
+        re.compile(r'cursor\.execute\([^,]+,\s*\(')
+    )
+}
+
+@lru_cache(maxsize=4096)
+def _cached_confidence(issue_type: str, severity: str, proof: str, is_test: bool) -> float:
+    """Confidence score for one (type, severity, proof, test-file) combination.
+
+    Generated or minified sources produce many identical proofs, so the
+    safe-pattern regex work here is memoized.
+    """
+    confidence = 1.0
+    confidence *= _SEVERITY_CONFIDENCE.get(severity, 0.5)
+
+    # Reduce confidence for test files
+    if is_test:
+        confidence *= 0.5
+
+    # Check for safe patterns
+    if any(p.search(proof) for p in _SAFE_PROOF_PATTERNS.get(issue_type, ())):
+        confidence *= 0.3
+
+    return confidence
+
+@dataclass(slots=True)
+class Issue:
+    """One analyzer finding; slots avoid a per-issue dict and its overhead"""
+    type: str
+    severity: str
+    description: str
+    line: int
+    proof: str
+    fix: str
+    confidence: float
+    # Sort keys stashed at emission so the final sort is a plain tuple fetch
+    rank: int
+    negconf: float
+
+def _newline_offsets(data) -> Sequence[int]:
+    """Offsets of every newline in a bytes buffer, for O(log n) line lookups.
+
+    Offsets are byte positions, matching what the bytes-compiled patterns
+    report, so line numbers stay exact regardless of encoding.
+    """
+    if np is not None:
+        return np.nonzero(np.frombuffer(data, np.uint8) == 0x0A)[0]
+    offsets = []
+    pos = data.find(b'\n')
+    while pos != -1:
+        offsets.append(pos)
+        pos = data.find(b'\n', pos + 1)
+    return offsets
 
 class CodeAnalyzer:
     def __init__(self):
@@ -60,13 +164,17 @@ class CodeAnalyzer:
         
         self.resource_patterns = {
             'file_leaks': {
-                'pattern': r'open\([^)]+\)(?!.*?with)',
+                # RE2 has no lookaround; the old (?!.*?with) lookahead is now a
+                # reject_after post-filter on the rest of the line
+                'pattern': r'open\([^)]+\)',
+                'reject_after': (b'with',),
                 'severity': 'High',
                 'description': 'File resource leak',
                 'fix': 'Use with statement'
             },
             'memory_leaks': {
-                'pattern': r'(?:append|extend|add)\([^)]*\)(?!.*?limit|.*?max)',
+                'pattern': r'(?:append|extend|add)\([^)]*\)',
+                'reject_after': (b'limit', b'max'),
                 'severity': 'High',
                 'description': 'Unbounded collection growth',
                 'fix': 'Add size limit'
@@ -82,7 +190,10 @@ class CodeAnalyzer:
                     'fix': 'Move hook to component top level'
                 },
                 'effect_deps': {
-                    'pattern': r'useEffect\([^,]+,\s*\[\s*\]\s*\)|useEffect\([^,]+,[^]]+\].*?(?!props|state)',
+                    # Trailing .*?(?!props|state) was vacuous (lazy dot plus a
+                    # lookahead that always finds an empty match); dropped so
+                    # the pattern stays within the RE2 subset
+                    'pattern': r'useEffect\([^,]+,\s*\[\s*\]\s*\)|useEffect\([^,]+,[^]]+\]',
                     'severity': 'High',
                     'description': 'Missing effect dependencies',
                     'fix': 'Add required dependencies'
@@ -114,13 +225,14 @@ class CodeAnalyzer:
                     'fix': 'Properly handle or propagate error'
                 },
                 'no_validation': {
-                    'pattern': r'req\.(?:body|params|query)\.[^\s]+(?!.*validate)',
+                    'pattern': r'req\.(?:body|params|query)\.[^\s]+',
+                    'reject_after': (b'validate',),
                     'severity': 'High',
                     'description': 'Missing input validation',
                     'fix': 'Add input validation'
                 },
                 'sync_code': {
-                    'pattern': r'app\.(get|post|put|delete)\([^,]+,\s*function\s*\([^)]*\)\s*{[^}]*await',
+                    'pattern': r'app\.(?:get|post|put|delete)\([^,]+,\s*function\s*\([^)]*\)\s*{[^}]*await',
                     'severity': 'High',
                     'description': 'Sync function with async code',
                     'fix': 'Add async keyword to function'
@@ -128,174 +240,371 @@ class CodeAnalyzer:
             }
         }
 
-    def analyze_file(self, file_path: str) -> List[Dict[str, Any]]:
+        # Intern the fixed-vocabulary strings so the thousands of issues a
+        # large scan emits all share one copy of each severity, description,
+        # and fix value instead of duplicating them per issue
+        for group in (self.security_patterns, self.resource_patterns,
+                      *self.framework_patterns.values()):
+            for pattern in group.values():
+                pattern['severity'] = sys.intern(pattern['severity'])
+                pattern['description'] = sys.intern(pattern['description'])
+                pattern['fix'] = sys.intern(pattern['fix'])
+
+        # Fused alternation of just the Critical security patterns, backing
+        # the has_critical boolean fast path; search() stops at the first hit
+        self._critical_regex = re.compile('|'.join(
+            f'(?:{pattern["pattern"]})'
+            for pattern in self.security_patterns.values()
+            if pattern['severity'] == 'Critical'
+        ).encode())
+
+        # Optional Hyperscan database over the security and resource patterns:
+        # one SIMD-accelerated block scan replaces the per-pattern finditer
+        # loops when the extension is installed. Built from the raw pattern
+        # strings, so it must precede the in-place compilation below.
+        self._hs_db = None
+        self._hs_patterns = []
+        if hyperscan is not None:
+            expressions = []
+            for group in (self.security_patterns, self.resource_patterns):
+                for name, pattern in group.items():
+                    self._hs_patterns.append((name, pattern))
+                    expressions.append(pattern['pattern'].encode())
+            try:
+                db = hyperscan.Database(mode=hyperscan.HS_MODE_BLOCK)
+                db.compile(
+                    expressions=expressions,
+                    ids=list(range(len(expressions))),
+                    flags=[hyperscan.HS_FLAG_SOM_LEFTMOST] * len(expressions),
+                )
+                self._hs_db = db
+            except Exception:
+                # A pattern fell outside the Hyperscan subset; keep the re path
+                self._hs_patterns = []
+
+        # Compile every pattern once up front; analyze_file runs them against
+        # many files and paying the re-cache lookup (or a recompile) per call
+        # adds up on large scans
+        for pattern in self.security_patterns.values():
+            pattern['pattern'] = re.compile(pattern['pattern'].encode())
+            if pattern.get('safe_pattern'):
+                pattern['safe_pattern'] = re.compile(pattern['safe_pattern'].encode())
+        for pattern in self.resource_patterns.values():
+            pattern['pattern'] = re.compile(pattern['pattern'].encode())
+
+        # Fuse each framework's patterns into one alternation with named
+        # groups, so a React file is scanned once instead of once per pattern
+        self._fw_regex = {}
+        self._fw_meta = {}
+        for framework, patterns in self.framework_patterns.items():
+            self._fw_regex[framework] = re.compile(
+                '|'.join(f'(?P<{name}>{p["pattern"]})' for name, p in patterns.items()).encode()
+            )
+            for pattern in patterns.values():
+                pattern['pattern'] = re.compile(pattern['pattern'].encode())
+            self._fw_meta[framework] = patterns
+
+
+        # Literal anchors per pattern: if none of a pattern's anchors appear
+        # in a file, the pattern cannot match and its regex is never run.
+        # Most files in a repo contain none of these tokens, so one cheap
+        # literal pass lets us skip the regex work entirely.
+        self._pattern_anchors = {
+            'hardcoded_secrets': (b'password', b'api_key', b'secret', b'token', b'JWT_SECRET'),
+            'sql_injection': (b'SELECT', b'INSERT', b'UPDATE', b'DELETE'),
+            'command_injection': (b'os.system', b'subprocess.run', b'exec', b'eval'),
+            'xss': (b'innerHTML', b'outerHTML', b'dangerouslySetInnerHTML', b'render_template_string'),
+            'insecure_deserialization': (b'pickle.loads', b'yaml.load', b'eval(', b'Function('),
+            'path_traversal': (b'open', b'readFile', b'writeFile'),
+            'weak_crypto': (b'md5(', b'sha1('),
+            'file_leaks': (b'open(',),
+            'memory_leaks': (b'append(', b'extend(', b'add('),
+            'hook_rules': (b'use',),
+            'effect_deps': (b'useEffect',),
+            'memory_leak': (b'useEffect',),
+            'unsafe_html': (b'dangerouslySetInnerHTML',),
+            'state_update': (b'set',),
+            'error_handling': (b'catch',),
+            'no_validation': (b'req.',),
+            'sync_code': (b'app.',),
+        }
+        anchor_tokens = {token for anchors in self._pattern_anchors.values()
+                         for token in anchors}
+        self._anchor_automaton = None
+        if ahocorasick is not None:
+            try:
+                automaton = ahocorasick.Automaton()
+                for token in anchor_tokens:
+                    automaton.add_word(token, token)
+                automaton.make_automaton()
+                self._anchor_automaton = automaton
+            except TypeError:
+                # pyahocorasick built without bytes support; the find-based
+                # sweep below covers it
+                pass
+        self._anchor_tokens = anchor_tokens
+
+
+    def analyze_file(self, file_path: str) -> List[Issue]:
         """Analyze a single file for issues"""
+        # Map the file instead of copying it into a fresh str; the patterns
+        # are compiled to bytes, so matching runs straight off the page cache
+        with open(file_path, 'rb') as f:
+            try:
+                content = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            except ValueError:
+                # Zero-length files cannot be mapped
+                content = f.read()
+            try:
+                return self._analyze_content(file_path, content)
+            finally:
+                if isinstance(content, mmap.mmap):
+                    content.close()
+
+    def has_critical(self, content) -> bool:
+        """Fast boolean check: does content match any Critical security pattern?
+
+        One fused alternation that stops at the first hit, for callers (CI
+        gates, pre-commit hooks) that only need a yes/no before deciding to
+        pay for a full analyze_file pass. Framework-specific Critical
+        patterns are not included since they depend on framework detection.
+        """
+        if isinstance(content, str):
+            content = content.encode()
+        return self._critical_regex.search(content) is not None
+
+    def file_has_critical(self, file_path: str) -> bool:
+        """has_critical over a memory-mapped file"""
+        with open(file_path, 'rb') as f:
+            try:
+                content = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            except ValueError:
+                # Zero-length files cannot be mapped
+                return self.has_critical(f.read())
+            try:
+                return self.has_critical(content)
+            finally:
+                content.close()
+
+    def _analyze_content(self, file_path: str, content) -> List[Issue]:
+        """Run every applicable pattern over a bytes buffer"""
         issues = []
-        
-        # Read file content
-        with open(file_path, 'r') as f:
-            content = f.read()
-        
+
         # Determine file type and framework
         file_type = self._get_file_type(file_path)
         framework = self._detect_framework(content)
+
+        # Newline offsets computed once; counting newlines per match made
+        # many-hit files quadratic in file size
+        newlines = _newline_offsets(content)
         
-        # Check security patterns
-        for name, pattern in self.security_patterns.items():
-            matches = re.finditer(pattern['pattern'], content)
-            for match in matches:
-                if pattern.get('safe_pattern') and re.search(pattern['safe_pattern'], content):
+        # Literal prefilter: one linear pass collecting which anchor tokens
+        # occur, so patterns with no anchor hit are skipped outright
+        hits = self._anchor_hits(content)
+
+        if self._hs_db is not None:
+            # Single Hyperscan block scan covering security+resource patterns
+            issues.extend(self._hyperscan_issues(content, newlines, hits, file_path))
+        else:
+            # Check security patterns
+            for name, pattern in self.security_patterns.items():
+                if not hits.intersection(self._pattern_anchors[name]):
+                    continue
+                if pattern.get('safe_pattern') and pattern['safe_pattern'].search(content):
                     continue
-                    
-                issues.append({
-                    'type': name,
-                    'severity': pattern['severity'],
-                    'description': pattern['description'],
-                    'line': content.count('\n', 0, match.start()) + 1,
-                    'proof': match.group(0),
-                    'fix': pattern['fix'],
-                    'confidence': self._calculate_confidence({
-                        'type': name,
-                        'severity': pattern['severity'],
-                        'proof': match.group(0),
-                        'file': file_path
-                    })
-                })
+                issues.extend(
+                    self._make_issue(name, pattern, match.start(), match.group(0),
+                                     newlines, file_path)
+                    for match in pattern['pattern'].finditer(content)
+                )
         
-        # Check resource patterns
-        for name, pattern in self.resource_patterns.items():
-            matches = re.finditer(pattern['pattern'], content)
-            for match in matches:
-                issues.append({
-                    'type': name,
-                    'severity': pattern['severity'],
-                    'description': pattern['description'],
-                    'line': content.count('\n', 0, match.start()) + 1,
-                    'proof': match.group(0),
-                    'fix': pattern['fix'],
-                    'confidence': self._calculate_confidence({
-                        'type': name,
-                        'severity': pattern['severity'],
-                        'proof': match.group(0),
-                        'file': file_path
-                    })
-                })
+            # Check resource patterns
+            for name, pattern in self.resource_patterns.items():
+                if not hits.intersection(self._pattern_anchors[name]):
+                    continue
+                issues.extend(
+                    self._make_issue(name, pattern, match.start(), match.group(0),
+                                     newlines, file_path)
+                    for match in pattern['pattern'].finditer(content)
+                    if not self._rejected(pattern, content, match.end())
+                )
         
-        # Check framework-specific patterns
-        if framework and framework in self.framework_patterns:
-            for name, pattern in self.framework_patterns[framework].items():
-                matches = re.finditer(pattern['pattern'], content)
-                for match in matches:
-                    issues.append({
-                        'type': name,
-                        'severity': pattern['severity'],
-                        'description': pattern['description'],
-                        'line': content.count('\n', 0, match.start()) + 1,
-                        'proof': match.group(0),
-                        'fix': pattern['fix'],
-                        'confidence': self._calculate_confidence({
-                            'type': name,
-                            'severity': pattern['severity'],
-                            'proof': match.group(0),
-                            'file': file_path
-                        })
-                    })
+        # Check framework-specific patterns. The fused alternation enumerates
+        # every position where some pattern starts (resuming at start+1 so a
+        # long match cannot swallow matches nested inside it); the individual
+        # patterns are then matched anchored at those few positions, so two
+        # patterns starting at the same offset are both reported.
+        if framework and framework in self._fw_regex and any(
+                hits.intersection(self._pattern_anchors[name])
+                for name in self._fw_meta[framework]):
+            meta = self._fw_meta[framework]
+            fw_regex = self._fw_regex[framework]
+            pos = 0
+            while True:
+                candidate = fw_regex.search(content, pos)
+                if not candidate:
+                    break
+                start = candidate.start()
+                pos = start + 1
+                for name, pattern in meta.items():
+                    match = pattern['pattern'].match(content, start)
+                    if not match or self._rejected(pattern, content, match.end()):
+                        continue
+                    issues.append(self._make_issue(name, pattern, start,
+                                                   match.group(0), newlines, file_path))
         
-        return sorted(issues, key=lambda x: (
-            {'Critical': 0, 'High': 1, 'Medium': 2, 'Low': 3}.get(x['severity'], 4),
-            -x['confidence']
-        ))
+        # Rank and negated confidence were stashed at emission, so the sort
+        # key is a plain tuple fetch with no per-compare dict rebuild
+        issues.sort(key=attrgetter('rank', 'negconf'))
+        return issues
+
+    def _make_issue(self, name: str, pattern: Dict, start: int, raw_proof: bytes,
+                    newlines: Sequence[int], file_path: str) -> Issue:
+        """Construct one Issue for a pattern match starting at start"""
+        # Proofs repeat heavily in generated or copy-pasted code; interning
+        # dedupes them across issues
+        proof = sys.intern(raw_proof.decode('utf-8', 'replace'))
+        severity = pattern['severity']
+        confidence = _cached_confidence(name, severity, proof,
+                                        'test' in file_path.lower())
+        return Issue(
+            type=name,
+            severity=severity,
+            description=pattern['description'],
+            line=bisect.bisect_right(newlines, start) + 1,
+            proof=proof,
+            fix=pattern['fix'],
+            confidence=confidence,
+            rank=_SEVERITY_RANK.get(severity, 4),
+            negconf=-confidence
+        )
+
+    def _hyperscan_issues(self, content, newlines, hits, file_path: str) -> List[Issue]:
+        """One Hyperscan pass over the security and resource patterns"""
+        raw = []
+        self._hs_db.scan(
+            bytes(content),
+            match_event_handler=lambda pid, start, end, flags, ctx: raw.append((pid, start, end))
+        )
+
+        # Hyperscan reports a match for every end offset; reduce to the
+        # non-overlapping leftmost-longest matches finditer would produce
+        per_id = {}
+        for pid, start, end in raw:
+            starts = per_id.setdefault(pid, {})
+            if end > starts.get(start, -1):
+                starts[start] = end
+
+        issues = []
+        for pid in sorted(per_id):
+            name, pattern = self._hs_patterns[pid]
+            if not hits.intersection(self._pattern_anchors[name]):
+                continue
+            if pattern.get('safe_pattern') and pattern['safe_pattern'].search(content):
+                continue
+            starts = per_id[pid]
+            last_end = -1
+            for start in sorted(starts):
+                if start < last_end:
+                    continue
+                end = starts[start]
+                if self._rejected(pattern, content, end):
+                    continue
+                last_end = end
+                issues.append(self._make_issue(name, pattern, start,
+                                               content[start:end], newlines, file_path))
+        return issues
+
+    def _anchor_hits(self, content) -> set:
+        """Collect the anchor tokens present in content in one linear pass"""
+        if self._anchor_automaton is not None and not isinstance(content, mmap.mmap):
+            return {token for _, token in self._anchor_automaton.iter(content)}
+        return {token for token in self._anchor_tokens if content.find(token) != -1}
+
+    @staticmethod
+    def _rejected(pattern: Dict, content, match_end: int) -> bool:
+        """Post-filter replacing lookahead: reject a match when any of the
+        pattern's reject_after tokens appear in the rest of its line"""
+        reject = pattern.get('reject_after')
+        if not reject:
+            return False
+        line_end = content.find(b'\n', match_end)
+        tail = content[match_end:] if line_end == -1 else content[match_end:line_end]
+        return any(token in tail for token in reject)
 
     def _get_file_type(self, file_path: str) -> str:
         """Determine file type from extension"""
-        ext = Path(file_path).suffix.lower()
-        return {
-            '.py': 'python',
-            '.js': 'javascript',
-            '.jsx': 'javascript',
-            '.ts': 'typescript',
-            '.tsx': 'typescript'
-        }.get(ext, 'unknown')
-
-    def _detect_framework(self, content: str) -> str:
-        """Detect framework from imports and patterns"""
-        frameworks = {
-            'react': r'(?:import.*?react|from\s+["\']react["\'])',
-            'express': r'(?:import.*?express|require\(["\']express["\'])',
-            'django': r'(?:from\s+django|import\s+django)',
-            'flask': r'(?:from\s+flask\s+import|import\s+flask)'
-        }
-        
-        for framework, pattern in frameworks.items():
-            if re.search(pattern, content):
+        # splitext avoids building a PurePath per call
+        return _EXT_MAP.get(os.path.splitext(file_path)[1].lower(), 'unknown')
+
+    # Frameworks are identified by short literal substrings; imports live in
+    # the first few KB, so a bounded substring test replaces four regex
+    # passes over the whole file
+    _FRAMEWORK_KEYWORDS = (
+        (b'react', 'react'),
+        (b'express', 'express'),
+        (b'django', 'django'),
+        (b'flask', 'flask'),
+    )
+
+    def _detect_framework(self, content) -> str:
+        """Detect framework from import literals in the file head"""
+        head = content[:4096]
+        for keyword, framework in self._FRAMEWORK_KEYWORDS:
+            if keyword in head:
                 return framework
         return None
 
     def _calculate_confidence(self, issue: Dict) -> float:
         """Calculate confidence score for an issue"""
-        confidence = 1.0
-        
-        # Base confidence by severity
-        confidence *= {
-            'Critical': 0.95,
-            'High': 0.85,
-            'Medium': 0.75,
-            'Low': 0.65
-        }.get(issue['severity'], 0.5)
-        
-        # Reduce confidence for test files
-        if 'test' in issue['file'].lower():
-            confidence *= 0.5
-        
-        # Check for safe patterns
-        if self._has_safe_pattern(issue):
-            confidence *= 0.3
-        
-        return confidence
+        return _cached_confidence(issue['type'], issue['severity'], issue['proof'],
+                                  'test' in issue['file'].lower())
 
     def _has_safe_pattern(self, issue: Dict) -> bool:
         """Check if issue matches known safe patterns"""
-        safe_patterns = {
-            'hardcoded_secrets': [
-                r'os\.getenv',
-                r'process\.env',
-                r'config\.get'
-            ],
-            'sql_injection': [
-                r'parameterize\(',
-                r'cursor\.execute\([^,]+,\s*\('
-            ]
-        }
-        
-        patterns = safe_patterns.get(issue['type'], [])
-        return any(re.search(p, issue['proof']) for p in patterns)
+        patterns = _SAFE_PROOF_PATTERNS.get(issue['type'], ())
+        return any(p.search(issue['proof']) for p in patterns)
+
+# One analyzer per worker process, built by the pool initializer so the
+# pattern compilation cost is paid once per worker rather than once per file
+_worker_analyzer = None
+
+def _init_worker():
+    global _worker_analyzer
+    _worker_analyzer = CodeAnalyzer()
+
+def _analyze_one(file_path: str):
+    """Analyze one file in a worker, returning (path, issues, error)"""
+    try:
+        return file_path, _worker_analyzer.analyze_file(file_path), None
+    except Exception as e:
+        return file_path, [], str(e)
 
 def main():
-    analyzer = CodeAnalyzer()
-    
     # Get all files in test_samples directory
-    import os
     test_files = [f for f in os.listdir('test_samples') if os.path.isfile(os.path.join('test_samples', f))]
-    
-    # Analyze each file
-    for file in test_files:
-        print(f"\n{'='*50}")
-        print(f"Analyzing {file}:")
-        print(f"{'='*50}")
-        
-        try:
-            issues = analyzer.analyze_file(os.path.join('test_samples', file))
+    paths = [os.path.join('test_samples', f) for f in test_files]
+
+    # Each file is independent, so fan analysis out across all cores; regex
+    # scanning holds the GIL, so processes rather than threads
+    with ProcessPoolExecutor(initializer=_init_worker) as executor:
+        for file, (_, issues, error) in zip(test_files, executor.map(_analyze_one, paths)):
+            print(f"\n{'='*50}")
+            print(f"Analyzing {file}:")
+            print(f"{'='*50}")
+
+            if error:
+                print(f"Error analyzing file: {error}")
+                continue
             if not issues:
                 print("No issues found.")
                 continue
-                
+
             for issue in issues:
-                print(f"\n{issue['severity']} ({issue['confidence']:.2f} confidence): {issue['type']}")
-                print(f"Line {issue['line']}: {issue['description']}")
-                print(f"Proof: {issue['proof']}")
-                print(f"Fix: {issue['fix']}")
-        except Exception as e:
-            print(f"Error analyzing file: {str(e)}")
+                print(f"\n{issue.severity} ({issue.confidence:.2f} confidence): {issue.type}")
+                print(f"Line {issue.line}: {issue.description}")
+                print(f"Proof: {issue.proof}")
+                print(f"Fix: {issue.fix}")
 
 if __name__ == '__main__':
     main()